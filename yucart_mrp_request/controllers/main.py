@@ -0,0 +1,62 @@
+import hashlib
+
+from odoo import http, fields
+from odoo.http import request
+from odoo.tools import SQL
+
+# Upper bound on yu_order_id values answered per poll
+MAX_POLL_ORDERS = 500
+
+
+class MrpRequestStatusController(http.Controller):
+
+    @http.route('/yucart/mrp_request/status', type='http', auth='user', methods=['GET'], readonly=True)
+    def mrp_request_status(self, orders='', **kwargs):
+        """Return request/MO status for a comma separated list of ``yu_order_id``.
+
+        Reads a single indexed query instead of going through search_read, so
+        no computed fields are evaluated; access rights and record rules still
+        apply through the ``_search`` subqueries. Answers 304 when the
+        caller's ETag (If-None-Match) is still current.
+        """
+        env = request.env
+        env['mrp.request'].check_access('read')
+        env['mrp.production'].check_access('read')
+        order_refs = list(dict.fromkeys(o.strip() for o in orders.split(',') if o.strip()))[:MAX_POLL_ORDERS]
+        if not order_refs:
+            return request.make_json_response({})
+
+        # Record rules are applied as subqueries, so only visible requests
+        # (and their visible MOs) are answered
+        request_query = env['mrp.request']._search([('yu_order_id', 'in', order_refs)])
+        production_query = env['mrp.production']._search([('mrp_request_id', 'in', request_query)])
+
+        # Latest request per order; GREATEST ignores a missing MO
+        env.cr.execute(SQL("""
+            SELECT DISTINCT ON (r.yu_order_id)
+                   r.yu_order_id, r.state, p.state, r.requested_date, r.expected_delivery_date,
+                   GREATEST(r.write_date, p.write_date), r.id, p.id
+              FROM mrp_request r
+         LEFT JOIN mrp_production p ON p.id = r.mrp_production_id AND p.id IN %s
+             WHERE r.id IN %s
+          ORDER BY r.yu_order_id, r.id DESC
+        """, production_query.subselect(), request_query.subselect()))
+        rows = env.cr.fetchall()
+
+        # The validator covers which rows are answered (ids) as well as their
+        # write dates, so deleted or newly hidden requests/MOs change it too.
+        # A single Last-Modified date cannot express that, hence ETag only.
+        etag = hashlib.sha1(repr([(row[0], row[5], row[6], row[7]) for row in rows]).encode()).hexdigest()
+        headers = [('ETag', f'"{etag}"'), ('Cache-Control', 'private, no-cache')]
+        if request.httprequest.if_none_match.contains(etag):
+            return request.make_response('', headers=headers, status=304)
+
+        return request.make_json_response({
+            yu_order_id: {
+                'state': state,
+                'production_state': production_state,
+                'requested_date': fields.Datetime.to_string(requested_date),
+                'expected_delivery_date': fields.Datetime.to_string(expected_delivery_date),
+            }
+            for yu_order_id, state, production_state, requested_date, expected_delivery_date, *_validator in rows
+        }, headers=headers)
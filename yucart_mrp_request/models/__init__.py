@@ -1,4 +1,6 @@
 from . import mrp_request
+from . import mrp_request_change
+from . import mrp_request_job
 from . import mrp_production
 from . import mrp_workorder
 from . import mrp_routing_workcenter
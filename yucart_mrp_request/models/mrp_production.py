@@ -43,36 +43,16 @@ class MrpProduction(models.Model):
             'product_id', 'product_qty', 'product_uom_id', 'date_start', 'date_deadline',
             'requested_date', 'expected_delivery_date', 'bom_id'
         ]
-        changes = []
-        for rec in self:
-            req = rec.mrp_request_id
-            if not req:
-                continue
-            for field in tracked_fields:
-                if field in vals:
-                    old = rec[field]
-                    new = vals[field]
-                    # Skip change request for start date if from produce all
-                    if field in ('date_start', 'date_deadline') and self.env.context.get('from_produce_all'):
-                        continue
-                    if isinstance(rec._fields[field], fields.Many2one):
-                        old_disp = old.display_name if old else False
-                        new_disp = self.env[rec._fields[field].comodel_name].browse(new).display_name if new else False
-                        if old_disp != new_disp:
-                            changes.append(f"{rec._fields[field].string} changed from '{old_disp}' to '{new_disp}'")
-                    else:
-                        if old != new:
-                            changes.append(f"{rec._fields[field].string} changed from '{old}' to '{new}'")
-        # Only update request state and note in the initial write, not in sync context
+        # Only update request state and log changes in the initial write, not in sync context
         # SKIP requesting change if moving to done or from produce all
-        if changes and not self.env.context.get('no_mrp_production_sync') and not (vals.get('state') == 'done') and not self.env.context.get('from_produce_all'):
-            req = self[0].mrp_request_id
-            if req:
-                change_note = "Change Requested: " + "; ".join(changes)
-                req.with_context(no_mrp_request_sync=True).write({
-                    'state': 'change_requested',
-                    'note': (req.note or '') + "\n" + change_note if req.note else change_note
-                })
+        if not self.env.context.get('no_mrp_production_sync') and not (vals.get('state') == 'done') and not self.env.context.get('from_produce_all'):
+            tracked_fields = [f for f in tracked_fields if f in vals]
+            linked = self.filtered('mrp_request_id') if tracked_fields else self.browse()
+            change_vals = self.env['mrp.request.change']._prepare_change_vals(linked, vals, tracked_fields, 'production')
+            if change_vals:
+                self.env['mrp.request.change'].create(change_vals)
+                requests = self.env['mrp.request'].browse(list({v['request_id'] for v in change_vals}))
+                requests.with_context(no_mrp_request_sync=True)._run_transition('field_change')
         res = super(MrpProduction, self).write(vals)
         # avoid recursion when called by request
         if self.env.context.get('no_mrp_production_sync'):
@@ -108,6 +88,11 @@ class MrpProduction(models.Model):
     def create(self, vals_list):
         # Only allow manual MO creation if linked to a request, else create request and link
         new_records = []
+        direct_requests = self.env['mrp.request']
+        # Prevent duplicate MO for same request (one lookup for the whole batch)
+        linked_request_ids = [vals['mrp_request_id'] for vals in vals_list if vals.get('mrp_request_id')]
+        if linked_request_ids and self.search_count([('mrp_request_id', 'in', linked_request_ids)], limit=1):
+            raise UserError(_("A Manufacturing Order already exists for this request."))
         for vals in vals_list:
             req = None
             # If no request linked, create one and submit to admin
@@ -123,16 +108,15 @@ class MrpProduction(models.Model):
                     'note': _("Created automatically from MO by %s") % self.env.user.name,
                 }
                 req = self.env['mrp.request'].create(req_vals)
-                # Directly submit to admin (skip Product Owner)
-                req.state = 'waiting_admin'
+                direct_requests |= req
                 vals['mrp_request_id'] = req.id
-            # Prevent duplicate MO for same request
-            if vals.get('mrp_request_id'):
-                existing_mo = self.search([('mrp_request_id', '=', vals['mrp_request_id'])], limit=1)
-                if existing_mo:
-                    raise UserError(_("A Manufacturing Order already exists for this request."))
             new_records.append(vals)
+        # Directly submit to admin (skip Product Owner)
+        direct_requests._run_transition('production_direct')
         records = super().create(new_records)
+        if self.env.context.get('mrp_request_prepared_vals'):
+            records._link_prepared_requests()
+            return records
         # Sync MO fields to request
         for rec in records:
             if rec.mrp_request_id:
@@ -149,6 +133,21 @@ class MrpProduction(models.Model):
                 rec.mrp_request_id.with_context(no_mrp_request_sync=True).write(update_vals)
         return records
 
+    def _link_prepared_requests(self):
+        """Link MOs built from ``mrp.request._prepare_production_vals`` back to their request.
+
+        Their fields already come from the request, so only the link (and an
+        MO-computed start date) is written back. Access is checked once for the
+        batch; the per-record values are flushed by the ORM in one UPDATE.
+        """
+        requests = self.mrp_request_id
+        requests.check_access('write')
+        for rec in self.sudo():
+            update_vals = {'mrp_production_id': rec.id}
+            if not rec.mrp_request_id.start_date:
+                update_vals['start_date'] = rec.date_start or rec.date_deadline
+            rec.mrp_request_id.with_context(no_mrp_request_sync=True).write(update_vals)
+
     @api.onchange('bom_id')
     def _onchange_bom_id_update_fields(self):
         if self.bom_id:
@@ -19,7 +19,7 @@ class MrpRequest(models.Model):
         readonly=True,
         default=lambda self: _('New')
     )
-    yu_order_id = fields.Char(string='External Order Reference')
+    yu_order_id = fields.Char(string='External Order Reference', index=True)
     product_id = fields.Many2one('product.product', string='Product', required=True)
     qty = fields.Float(string='Quantity', required=True, default=1.0)
     uom_id = fields.Many2one(
@@ -92,6 +92,13 @@ class MrpRequest(models.Model):
         tracking=True
     )
     auto_submitted_po = fields.Boolean(string="Auto Submitted to Product Owner", default=False)
+    change_ids = fields.One2many('mrp.request.change', 'request_id', string='Change History', readonly=True)
+    job_ids = fields.One2many('mrp.request.job', 'request_id', string='Manufacturing Order Jobs', readonly=True)
+    job_state = fields.Selection([
+        ('pending', 'Pending'),
+        ('failed', 'Failed'),
+    ], string='Manufacturing Order Job', compute='_compute_job_state')
+    job_error = fields.Text(string='Manufacturing Order Job Error', compute='_compute_job_state')
 
     # === Sequence Generation ===
     @api.model
@@ -187,6 +194,13 @@ class MrpRequest(models.Model):
             ], limit=1)
             rec.bom_exists = bool(bom)
 
+    @api.depends('job_ids.state', 'job_ids.error')
+    def _compute_job_state(self):
+        for rec in self:
+            failed = rec.job_ids.filtered(lambda j: j.state == 'failed')
+            rec.job_state = 'failed' if failed else ('pending' if rec.job_ids else False)
+            rec.job_error = failed[-1:].error or False
+
     @api.depends()
     def _compute_product_owner_ids(self):
         group = self.env.ref('yucart_mrp_request.group_product_owner', raise_if_not_found=False)
@@ -199,6 +213,177 @@ class MrpRequest(models.Model):
         for rec in self:
             rec.admin_ids = group.user_ids if group else self.env['res.users'].search([])
 
+    # === State Machine ===
+    # Each transition declares the source states it accepts (None = any), the
+    # target state, the guards evaluated on the whole recordset beforehand and
+    # the side effects run in batch once the new state is written.
+    _STATE_TRANSITIONS = {
+        'submit_po': {
+            'from': ('new',),
+            'to': 'pending_po',
+            'guards': (),
+            'effects': ('_effect_create_productions',),
+        },
+        'accept_by_po': {
+            'from': ('pending_po',),
+            'to': 'waiting_admin',
+            'guards': ('_guard_product_owner',),
+            'effects': (),
+        },
+        'request_change': {
+            'from': ('new', 'pending_po', 'waiting_admin', 'approved'),
+            'to': 'change_requested',
+            'guards': ('_guard_change_reason',),
+            'effects': ('_effect_notify_admin_change',),
+        },
+        'approve_admin': {
+            'from': ('waiting_admin', 'change_requested'),
+            'to': 'approved',
+            'guards': ('_guard_admin_approve', '_guard_bom'),
+            'effects': ('_effect_confirm_productions',),
+        },
+        'reject': {
+            'from': ('waiting_admin', 'change_requested'),
+            'to': 'rejected',
+            'guards': ('_guard_admin_reject',),
+            'effects': ('_effect_cancel_jobs', '_effect_unlink_productions'),
+        },
+        # Tracked fields edited on the request or its MO
+        'field_change': {
+            'from': None,
+            'to': 'change_requested',
+            'guards': (),
+            'effects': (),
+        },
+        # MO created manually without a request skips the Product Owner; the
+        # new request may already be change_requested (design team routing)
+        'production_direct': {
+            'from': None,
+            'to': 'waiting_admin',
+            'guards': (),
+            'effects': (),
+        },
+    }
+
+    def _run_transition(self, transition_name):
+        """Move the whole recordset through a declared transition.
+
+        Guards see every record before anything is written, the state is
+        written once for the records not already in the target state, and
+        side effects receive the full recordset. Records already in the
+        target state pass the source check.
+        """
+        transition = self._STATE_TRANSITIONS[transition_name]
+        if not self:
+            return self
+        sources = transition['from']
+        if sources is not None:
+            invalid = self.filtered(lambda r: r.state not in sources and r.state != transition['to'])
+            if invalid:
+                state_labels = dict(self._fields['state']._description_selection(self.env))
+                raise UserError(_("Request %(name)s cannot go from '%(state)s' to '%(target)s'.") % {
+                    'name': invalid[0].name,
+                    'state': state_labels.get(invalid[0].state),
+                    'target': state_labels.get(transition['to']),
+                })
+        for guard in transition['guards']:
+            getattr(self, guard)()
+        self._write_state(transition['to'])
+        for effect in transition['effects']:
+            getattr(self, effect)()
+        return self
+
+    def _write_state(self, state):
+        to_write = self.filtered(lambda r: r.state != state)
+        if to_write:
+            to_write.write({'state': state})
+
+    # --- Guards ---
+    def _guard_product_owner(self):
+        if self.filtered(lambda r: r.product_owner_id != self.env.user):
+            raise UserError(_("Only the assigned Product Owner can verify this request."))
+
+    def _guard_admin_approve(self):
+        if self.filtered(lambda r: r.admin_id != self.env.user):
+            raise UserError(_("Only the assigned Production Manager can approve this request."))
+
+    def _guard_admin_reject(self):
+        if self.filtered(lambda r: r.admin_id != self.env.user):
+            raise UserError(_("Only the assigned Production Manager can reject this request."))
+
+    def _guard_bom(self):
+        missing = self.filtered(lambda r: not r.bom_id)
+        if missing:
+            raise UserError(_("Please select a Bill of Materials (BOM) for product %s") % missing[0].product_id.display_name)
+
+    def _guard_change_reason(self):
+        if self.filtered(lambda r: not r.note):
+            raise UserError(_("Please provide a reason for the change request in the Notes tab."))
+
+    # --- Side effects ---
+    def _prepare_production_vals(self):
+        self.ensure_one()
+        return {
+            'product_id': self.product_id.id,
+            'product_qty': self.qty,
+            'product_uom_id': self.uom_id.id,
+            'bom_id': self.bom_id.id,
+            'date_start': self.start_date,
+            'date_deadline': self.start_date,
+            'origin': self.name,
+            'user_id': self.product_owner_id.id,
+            'mrp_request_id': self.id,
+            'name': f"MO{self.name[2:]}",  # Set MO number to match request
+            'requested_date': self.requested_date,
+            'expected_delivery_date': self.expected_delivery_date,  # <-- sync expected_delivery_date
+        }
+
+    def _create_productions(self):
+        # Create Manufacturing Orders for requests that do not have one yet;
+        # mrp.production.create links them back to their request.
+        to_create = self.filtered(lambda r: not r.mrp_production_id)
+        if to_create:
+            self.env['mrp.production'].with_context(mrp_request_prepared_vals=True).create(
+                [rec._prepare_production_vals() for rec in to_create]
+            )
+            # A queued creation can land after the admin already approved
+            to_create.filtered(lambda r: r.state == 'approved')._confirm_productions()
+
+    def _confirm_productions(self):
+        productions = self.mrp_production_id.filtered(lambda p: p.state == 'draft')
+        if productions:
+            productions.action_confirm()
+
+    # In async mode the MO work is queued as mrp.request.job rows and run by cron
+    def _effect_create_productions(self):
+        if self.env['mrp.request.job']._is_async_enabled():
+            self.env['mrp.request.job']._enqueue(self.filtered(lambda r: not r.mrp_production_id), 'create_production')
+        else:
+            self._create_productions()
+
+    def _effect_confirm_productions(self):
+        if self.env['mrp.request.job']._is_async_enabled():
+            self.env['mrp.request.job']._enqueue(self, 'confirm_production')
+        else:
+            self._confirm_productions()
+
+    def _effect_cancel_jobs(self):
+        if self.job_ids:
+            self.job_ids.sudo().unlink()
+
+    def _effect_unlink_productions(self):
+        productions = self.mrp_production_id
+        if productions:
+            productions.unlink()
+            self.write({'mrp_production_id': False})
+
+    def _effect_notify_admin_change(self):
+        for rec in self.filtered('admin_id'):
+            rec.message_post(
+                body=_("Change requested by Product Owner: %s") % rec.note,
+                partner_ids=[rec.admin_id.partner_id.id]
+            )
+
     # === Workflow Actions ===
     def _requests_list_action(self):
         """Build an act_window dict referencing view ids (no read on ir.actions.act_window)."""
@@ -233,72 +418,30 @@ class MrpRequest(models.Model):
 
     def action_submit_po(self):
         """ new → pending_po """
-        for rec in self:
-            rec.state = 'pending_po'
-            # Create Manufacturing Order if not already created
-            if not rec.mrp_production_id:
-                mo_vals = {
-                    'product_id': rec.product_id.id,
-                    'product_qty': rec.qty,
-                    'product_uom_id': rec.uom_id.id,
-                    'bom_id': rec.bom_id.id,
-                    'date_start': rec.start_date,
-                    'date_deadline': rec.start_date,
-                    'origin': rec.name,
-                    'user_id': rec.product_owner_id.id,
-                    'mrp_request_id': rec.id,
-                    'name': f"MO{rec.name[2:]}",  # Set MO number to match request
-                    'requested_date': rec.requested_date,
-                    'expected_delivery_date': rec.expected_delivery_date,  # <-- sync expected_delivery_date
-                }
-                mo = self.env['mrp.production'].create(mo_vals)
-                rec.mrp_production_id = mo.id
+        self._run_transition('submit_po')
         return self._requests_list_action()
 
     def action_accept_by_po(self):
         """ pending_po → waiting_admin, only Product Owner """
-        for rec in self:
-            if rec.product_owner_id != self.env.user:
-                raise UserError(_("Only the assigned Product Owner can verify this request."))
-            rec.state = 'waiting_admin'
+        self._run_transition('accept_by_po')
         return self._requests_list_action()
 
     def action_request_change(self):
         """ pending_po → change_requested, reason required, notify Admin """
-        for rec in self:
-            if not rec.note:
-                raise UserError(_("Please provide a reason for the change request in the Notes tab."))
-            rec.state = 'change_requested'
-            # Notify Admin (Production Manager)
-            if rec.admin_id:
-                rec.message_post(
-                    body=_("Change requested by Product Owner: %s") % rec.note,
-                    partner_ids=[rec.admin_id.partner_id.id]
-                )
+        self._run_transition('request_change')
 
     def action_approve_admin(self):
         """ waiting_admin → approved, only Admin """
-        for rec in self:
-            if rec.admin_id != self.env.user:
-                raise UserError(_("Only the assigned Production Manager can approve this request."))
-            if not rec.bom_id:
-                raise UserError(_("Please select a Bill of Materials (BOM) for product %s") % rec.product_id.display_name)
-            rec.state = 'approved'
-            # Confirm the corresponding Manufacturing Order if exists
-            if rec.mrp_production_id and rec.mrp_production_id.state == 'draft':
-                rec.mrp_production_id.action_confirm()
+        self._run_transition('approve_admin')
         return self._requests_list_action()
 
     def action_reject(self):
         """ waiting_admin → rejected, only Admin """
-        for rec in self:
-            if rec.admin_id != self.env.user:
-                raise UserError(_("Only the assigned Production Manager can reject this request."))
-            rec.state = 'rejected'
-            # Delete related manufacturing order if exists
-            if rec.mrp_production_id:
-                rec.mrp_production_id.unlink()
-                rec.mrp_production_id = False
+        self._run_transition('reject')
+
+    def action_retry_jobs(self):
+        """ Requeue failed Manufacturing Order jobs """
+        self.job_ids.filtered(lambda j: j.state == 'failed').action_retry()
 
     def _create_activity_for_product_owner(self):
         """Create a reminder activity for Product Owner if request is pending."""
@@ -409,32 +552,27 @@ class MrpRequest(models.Model):
     def write(self, vals):
         tracked_fields = [
             'product_id', 'qty', 'uom_id', 'start_date', 'requested_date',
-            'expected_delivery_date', 'bom_id', 'product_owner_id', 'admin_id', 'note'
+            'expected_delivery_date', 'bom_id', 'product_owner_id', 'admin_id'
         ]
-        changes = []
-        for rec in self:
-            for field in tracked_fields:
-                if field in vals:
-                    old = rec[field]
-                    new = vals[field]
-                    if isinstance(rec._fields[field], fields.Many2one):
-                        old_disp = old.display_name if old else False
-                        new_disp = self.env[rec._fields[field].comodel_name].browse(new).display_name if new else False
-                        if old_disp != new_disp:
-                            changes.append(f"{rec._fields[field].string} changed from '{old_disp}' to '{new_disp}'")
-                    else:
-                        if old != new:
-                            changes.append(f"{rec._fields[field].string} changed from '{old}' to '{new}'")
-        # Only update state and note in the initial write, not in sync context
-        if changes and not self.env.context.get('no_mrp_request_sync'):
-            vals = dict(vals)  # copy to avoid mutating caller
-            vals['state'] = 'change_requested'
-            change_note = "Change Requested: " + "; ".join(changes)
-            vals['note'] = (self[0].note or '') + "\n" + change_note if self[0].note else change_note
+        # Only update state and log changes in the initial write, not in sync context.
+        # Only the tracked fields actually being written are diffed, so
+        # state-only writes from the state machine skip the diff entirely.
+        tracked_fields = [f for f in tracked_fields if f in vals]
+        changed = self.browse()
+        if tracked_fields and not self.env.context.get('no_mrp_request_sync'):
+            change_vals = self.env['mrp.request.change']._prepare_change_vals(self, vals, tracked_fields, 'request')
+            if change_vals:
+                self.env['mrp.request.change'].create(change_vals)
+                changed = self.browse(list({v['request_id'] for v in change_vals}))
         res = super(MrpRequest, self).write(vals)
+        # Only the requests whose tracked values actually changed
+        changed._run_transition('field_change')
         # avoid recursion when called by production
         if self.env.context.get('no_mrp_request_sync'):
             return res
+        sync_fields = ('start_date', 'requested_date', 'expected_delivery_date', 'product_id', 'bom_id', 'qty', 'uom_id')
+        if not any(k in vals for k in sync_fields):
+            return res
         for rec in self:
             if not rec.mrp_production_id:
                 continue
@@ -0,0 +1,84 @@
+from odoo import models, fields, api
+
+
+class MrpRequestChange(models.Model):
+    _name = 'mrp.request.change'
+    _description = 'Manufacturing Request Change'
+    _order = 'date desc, id desc'
+    # user_id and date are stored explicitly, skip the create/write audit columns
+    _log_access = False
+
+    request_id = fields.Many2one(
+        'mrp.request',
+        string='Request',
+        required=True,
+        ondelete='cascade',
+        readonly=True
+    )
+    field_id = fields.Many2one(
+        'ir.model.fields',
+        string='Field',
+        required=True,
+        ondelete='cascade',
+        readonly=True
+    )
+    old_value = fields.Char(string='Old Value', readonly=True)
+    new_value = fields.Char(string='New Value', readonly=True)
+    user_id = fields.Many2one(
+        'res.users',
+        string='Changed By',
+        default=lambda self: self.env.user,
+        readonly=True
+    )
+    date = fields.Datetime(
+        string='Changed On',
+        required=True,
+        default=fields.Datetime.now,
+        readonly=True
+    )
+    source = fields.Selection([
+        ('request', 'Request'),
+        ('production', 'Manufacturing Order'),
+    ], string='Source', required=True, default='request', readonly=True)
+
+    _request_date_idx = models.Index('(request_id, date)')
+
+    @api.model
+    def _format_value(self, field, value):
+        if isinstance(field, fields.Many2one):
+            return value.display_name if value else ''
+        if value is False or value is None:
+            return ''
+        return str(value)
+
+    @api.model
+    def _prepare_change_vals(self, records, vals, field_names, source):
+        """Diff ``vals`` against ``records`` (requests or MOs) before a write.
+
+        Returns one create dict per tracked field whose value actually
+        changes; records without a linked request are ignored.
+        """
+        change_vals = []
+        field_ids = {
+            name: self.env['ir.model.fields']._get(records._name, name).id
+            for name in field_names
+        }
+        for rec in records:
+            request = rec if rec._name == 'mrp.request' else rec.mrp_request_id
+            if not request:
+                continue
+            for name in field_names:
+                field = rec._fields[name]
+                old = rec[name]
+                # Normalise the raw write value (ids, date strings) to the record value
+                new = field.convert_to_record(field.convert_to_cache(vals[name], rec), rec)
+                if old == new:
+                    continue
+                change_vals.append({
+                    'request_id': request.id,
+                    'field_id': field_ids[name],
+                    'old_value': self._format_value(field, old),
+                    'new_value': self._format_value(field, new),
+                    'source': source,
+                })
+        return change_vals
@@ -0,0 +1,120 @@
+from odoo import models, fields, api
+from datetime import timedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Request method doing the actual work for each job type
+JOB_METHODS = {
+    'create_production': '_create_productions',
+    'confirm_production': '_confirm_productions',
+}
+
+
+class MrpRequestJob(models.Model):
+    _name = 'mrp.request.job'
+    _description = 'Manufacturing Request Job'
+    _order = 'id'
+
+    _MAX_ATTEMPTS = 3
+    _RETRY_DELAY_MINUTES = 5
+
+    request_id = fields.Many2one(
+        'mrp.request',
+        string='Request',
+        required=True,
+        ondelete='cascade',
+        index=True
+    )
+    job_type = fields.Selection([
+        ('create_production', 'Create Manufacturing Order'),
+        ('confirm_production', 'Confirm Manufacturing Order'),
+    ], string='Job', required=True)
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('failed', 'Failed'),
+    ], string='Status', required=True, default='pending', index=True)
+    attempts = fields.Integer(string='Attempts', default=0)
+    scheduled_at = fields.Datetime(string='Scheduled At', required=True, default=fields.Datetime.now)
+    error = fields.Text(string='Error')
+
+    @api.model
+    def _is_async_enabled(self):
+        return self.env['ir.config_parameter'].sudo().get_param('yucart_mrp_request.async_production') in ('1', 'True', 'true')
+
+    @api.model
+    def _trigger_processing(self, at=None):
+        cron = self.env.ref('yucart_mrp_request.ir_cron_process_request_jobs', raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger(at)
+
+    @api.model
+    def _enqueue(self, requests, job_type):
+        """Queue one job per request; an existing job of the same type is reused.
+
+        Users only read jobs, so queueing runs as sudo once the caller's
+        transition has passed its guards.
+        """
+        existing = self.sudo().search([
+            ('request_id', 'in', requests.ids),
+            ('job_type', '=', job_type),
+        ])
+        # A failed job is reset instead of leaving it next to a new one
+        failed = existing.filtered(lambda j: j.state == 'failed')
+        if failed:
+            failed._reset()
+        to_queue = requests - existing.request_id
+        jobs = self.sudo().create([{'request_id': req.id, 'job_type': job_type} for req in to_queue])
+        if jobs or failed:
+            self._trigger_processing()
+        return existing | jobs
+
+    def _run_batch(self):
+        """Run jobs of a single type together, falling back to one by one on failure."""
+        try:
+            with self.env.cr.savepoint():
+                getattr(self.request_id, JOB_METHODS[self[0].job_type])()
+        except Exception as e:
+            if len(self) > 1:
+                for job in self:
+                    job._run_batch()
+                return
+            self._register_failure(e)
+            return
+        self.sudo().unlink()
+
+    def _register_failure(self, error):
+        self.ensure_one()
+        _logger.error("Request job %s (%s) failed for %s: %s", self.id, self.job_type, self.request_id.name, error)
+        attempts = self.attempts + 1
+        if attempts >= self._MAX_ATTEMPTS:
+            self.sudo().write({'attempts': attempts, 'state': 'failed', 'error': str(error)})
+            return
+        retry_at = fields.Datetime.now() + timedelta(minutes=self._RETRY_DELAY_MINUTES * attempts)
+        self.sudo().write({'attempts': attempts, 'scheduled_at': retry_at, 'error': str(error)})
+        self._trigger_processing(retry_at)
+
+    def _reset(self):
+        self.sudo().write({'state': 'pending', 'attempts': 0, 'scheduled_at': fields.Datetime.now(), 'error': False})
+
+    def action_retry(self):
+        # Only requeue jobs of requests the user can act on
+        self.request_id.check_access('write')
+        self._reset()
+        self._trigger_processing()
+
+    @api.model
+    def cron_process_jobs(self, *, limit=50):
+        """Run pending MO jobs in batches; creation jobs go before confirmation jobs."""
+        domain = [
+            ('state', '=', 'pending'),
+            ('scheduled_at', '<=', fields.Datetime.now()),
+        ]
+        jobs = self.search(domain, limit=limit)
+        done = len(jobs)
+        for job_type in JOB_METHODS:
+            batch = jobs.filtered(lambda j: j.job_type == job_type)
+            if batch:
+                batch._run_batch()
+        remaining = self.search_count(domain) if done == limit else 0
+        self.env['ir.cron']._commit_progress(done, remaining=remaining)